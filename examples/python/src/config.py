@@ -3,16 +3,27 @@ from dataclasses import dataclass
 from typing import Dict, Any
 
 from .exceptions import ConfigurationError
+from .models import DATACLASS_SLOTS
 
+# UUID-like pattern validation (32 hex chars)
+_ID_LENGTH = 32
+_ID_PATTERN = re.compile(r"[a-f0-9]{32}")
 
-@dataclass(frozen=True)
+
+def _is_hex_id(value: str) -> bool:
+    """Check for a 32-char hex ID, rejecting wrong lengths before the regex runs."""
+    return len(value) == _ID_LENGTH and _ID_PATTERN.fullmatch(value) is not None
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ComponentConfig:
     """Immutable configuration for a WASM component execution.
 
     Args:
         application_id: Unique identifier for the application
         action_id: Unique identifier for the action
-        payload: Input data for the component
+        payload: Input data for the component, with the action input as a
+            dictionary under "input" (serialized to JSON once, at execution)
         wasm_file: Path to the WASM file
         timeout: Maximum execution time in seconds
 
@@ -26,6 +37,28 @@ class ComponentConfig:
     wasm_file: str = "actions.wasm"
     timeout: int = 30
 
+    @classmethod
+    def unchecked(
+        cls,
+        application_id: str,
+        action_id: str,
+        payload: Dict[str, Any],
+        wasm_file: str = "actions.wasm",
+        timeout: int = 30,
+    ) -> "ComponentConfig":
+        """Create a configuration without running validation.
+
+        Only for trusted internal callers that have already validated
+        these values, such as repeated calls with the same IDs.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, "application_id", application_id)
+        object.__setattr__(self, "action_id", action_id)
+        object.__setattr__(self, "payload", payload)
+        object.__setattr__(self, "wasm_file", wasm_file)
+        object.__setattr__(self, "timeout", timeout)
+        return self
+
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         self._validate_ids()
@@ -34,19 +67,16 @@ class ComponentConfig:
 
     def _validate_ids(self) -> None:
         """Validate application and action IDs."""
-        # UUID-like pattern validation (32 hex chars)
-        id_pattern = re.compile(r"^[a-f0-9]{32}$")
-
         if not self.application_id or not isinstance(self.application_id, str):
             raise ConfigurationError("application_id must be a non-empty string")
 
-        if not id_pattern.match(self.application_id):
+        if not _is_hex_id(self.application_id):
             raise ConfigurationError("application_id must be a 32-character hex string")
 
         if not self.action_id or not isinstance(self.action_id, str):
             raise ConfigurationError("action_id must be a non-empty string")
 
-        if not id_pattern.match(self.action_id):
+        if not _is_hex_id(self.action_id):
             raise ConfigurationError("action_id must be a 32-character hex string")
 
     def _validate_timeout(self) -> None:
@@ -1,8 +1,12 @@
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# Slotted dataclasses drop the per-instance __dict__ but need Python 3.10+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExecutionResult:
     """Immutable result of WASM component execution."""
 
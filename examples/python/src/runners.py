@@ -1,58 +1,292 @@
+import asyncio
+import collections.abc
+import concurrent.futures
 import subprocess
+import functools
 import json
+import os
+import selectors
 import sys
 import shutil
 import logging
+import threading
 import time
-from typing import Dict, Any, Tuple, Optional
-from pathlib import Path
-from contextlib import contextmanager
+from typing import Dict, Any, Tuple, Optional, Iterable, List, Mapping, Union
+
+try:
+    import wasmtime  # type: ignore
+    from wasmtime import component as wasm_component  # type: ignore
+except ImportError:  # wasmtime-py is optional, fall back to the CLI
+    wasmtime = None  # type: ignore[assignment]
+    wasm_component = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None  # type: ignore[assignment]
 
 from .exceptions import WasmEnvironmentError, ConfigurationError, ExecutionError
 from .models import ExecutionResult
 from .config import ComponentConfig
+from . import wave
+
+# Execution output: text from in-process calls, or process output kept as
+# bytes until it actually has to be decoded
+_Output = Union[str, bytes]
+
+_EPOCH_TICK = 1.0  # Seconds per engine epoch, bounds timeout precision
+
+# json.dumps builds a new encoder whenever options are passed, so reuse one
+_json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed.
+
+    Both implementations keep non-ASCII characters as-is, but their output
+    is not identical: floats are spelled differently (``1e16`` vs
+    ``1e+16``) and orjson writes NaN and infinity as ``null``. Values orjson
+    cannot encode, such as integers wider than 64 bits, are serialized with
+    the standard library instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            pass  # Let the standard library encode it or raise the error
+    return _json_encode(obj)
+
+
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+_logging_lock = threading.Lock()
+_logging_configured = False
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging(level: str) -> None:
+    """Configure structured logging and set the runners' log level.
+
+    Handlers are installed only the first time. The level applies to the
+    logger shared by all runners in the process, so the most recently
+    created runner's log_level takes effect for every runner.
+
+    Raises:
+        ConfigurationError: If the log level is invalid
+    """
+    global _logging_configured
+
+    log_level = _LOG_LEVELS.get(level.upper())
+    if log_level is None:
+        raise ConfigurationError(f"Invalid log level: {level}")
+
+    if not _logging_configured:
+        with _logging_lock:
+            if not _logging_configured:
+                logging.basicConfig(
+                    level=log_level,
+                    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                    handlers=[
+                        logging.StreamHandler(sys.stdout),
+                    ],
+                )
+                _logging_configured = True
+
+    logger.setLevel(log_level)
+
+
+_executables: Dict[str, str] = {}
+
+
+def _find_executable(name: str) -> Optional[str]:
+    """Look up an executable on PATH, once per process if it is found.
+
+    Failed lookups are not cached, so an executable installed later is
+    still picked up.
+    """
+    path = _executables.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _executables[name] = path
+    return path
+
+
+@functools.lru_cache(maxsize=16)
+def _realpath(path: str) -> str:
+    """Resolve the symlinks in an absolute path once per process."""
+    return os.path.realpath(path)
+
+
+def _resolve_wasm(path: str) -> str:
+    """Resolve a WASM file to an absolute path.
+
+    Relative paths are made absolute against the current working directory
+    on every call, so only the symlink resolution is cached. Whether the
+    file exists is not checked.
+    """
+    return _realpath(os.path.abspath(path))
+
+
+_runtime_lock = threading.Lock()
+_runtime: Optional[Tuple[Any, Any]] = None
+
+
+def _create_engine() -> Any:
+    """Create a wasmtime engine whose epoch is advanced by a daemon thread.
+
+    The epoch lets stores be given a deadline.
+    """
+    config = wasmtime.Config()
+    config.epoch_interruption = True
+    # Spread cold-start compilation of large components across all cores
+    config.parallel_compilation = True
+    try:
+        # Persists compiled artifacts on disk so restarts skip recompilation
+        config.cache = True
+    except wasmtime.WasmtimeError:
+        pass  # Compile without the on-disk cache
+
+    engine = wasmtime.Engine(config)
+
+    def tick() -> None:
+        while True:
+            time.sleep(_EPOCH_TICK)
+            engine.increment_epoch()
+
+    threading.Thread(target=tick, name="wasmtime-epoch", daemon=True).start()
+    return engine
+
+
+def _create_linker(engine: Any) -> Any:
+    """Create a linker with WASI and WASI HTTP registered.
+
+    Registering the WASI host functions is one of the most expensive
+    per-call costs, and the linker is never modified after this point, so
+    it is safe to share across every store and thread.
+    """
+    linker = wasm_component.Linker(engine)
+    linker.add_wasip2()
+    linker.add_wasi_http()
+    return linker
+
+
+def _get_runtime() -> Tuple[Any, Any]:
+    """Return the process-wide wasmtime engine and linker.
+
+    Engines are thread-safe and expensive to create, so a single one is
+    shared by every runner. Both are created under a lock: components,
+    linkers and stores from different engines cannot be mixed, so runners
+    created concurrently must never end up with engines of their own.
+    """
+    global _runtime
+
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                engine = _create_engine()
+                _runtime = (engine, _create_linker(engine))
+    return _runtime
+
+
+def _get_engine() -> Any:
+    """Return the process-wide wasmtime engine."""
+    return _get_runtime()[0]
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(path: str, mtime_ns: int, size: int) -> Any:
+    """Compile a component once per file version.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so replacing
+    the WASM file on disk triggers a recompile.
+    """
+    return wasm_component.Component.from_file(_get_engine(), path)
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_export(
+    component: Any, interface: str, name: str
+) -> Optional[Tuple[Any, wave.ResultFormatter]]:
+    """Resolve an exported function of a compiled component once.
+
+    The function is looked up in the exported ``interface`` instance first,
+    which is where Betty Blocks components export it, then at the root.
+
+    Returns:
+        Tuple of (export index, formatter for the function's result), or
+        ``None`` if the component has no such export
+    """
+    engine = _get_engine()
+    exports = component.type.exports(engine)
+
+    instance = component.get_export_index(interface)
+    if instance is not None:
+        index = component.get_export_index(name, instance)
+        if index is not None:
+            exports = exports[interface].ty.exports(engine)
+            return index, wave.result_formatter(exports[name].ty.result)
+
+    index = component.get_export_index(name)
+    if index is None:
+        return None
+    return index, wave.result_formatter(exports[name].ty.result)
 
 
 class WasmRunner:
-    """Robust runner for executing WASM components using wasmtime CLI.
+    """Robust runner for executing WASM components using wasmtime.
 
     This class provides a secure and reliable interface for executing
     WASM components with comprehensive error handling and validation.
+    Components are executed in-process through the wasmtime Python bindings
+    when they are installed, otherwise the wasmtime CLI is used.
     """
 
     # Constants
     CLI_TOOL = "wasmtime"
-    CLI_FLAGS = ["-S", "http"]
+    # Enable the on-disk compilation cache so repeated runs skip recompiling
+    CLI_FLAGS = ["-S", "http", "-C", "cache=y"]
+    # Optional wasmtime cache TOML; wasmtime's default config is used if unset
+    CACHE_CONFIG: Optional[str] = None
     MAX_OUTPUT_SIZE = 1024 * 1024  # 1MB
+    EXPORT_INTERFACE = "betty-blocks:custom/actions@0.1.0"
+    EXPORT_NAME = "call"
+    INVOKE_TEMPLATE = (
+        'call({{application-id: "{application_id}", action-id: "{action_id}", '
+        "payload: {{input: {payload_input}}}}})"
+    )
 
     def __init__(self, log_level: str = "INFO") -> None:
         """Initialize the WASM runner.
 
         Args:
-            log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL),
+                applied process-wide to every runner
 
         Raises:
             WasmEnvironmentError: If required tools are not available
         """
-        self._setup_logging(log_level)
-        self._validate_environment()
+        _configure_logging(log_level)
+        self.logger = logger
+        self.logger.info("WASM runner initialized", extra={"log_level": log_level})
 
-    def _setup_logging(self, level: str) -> None:
-        """Configure structured logging."""
-        try:
-            log_level = getattr(logging, level.upper())
-        except AttributeError:
-            raise ConfigurationError(f"Invalid log level: {level}")
-
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-            ],
-        )
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.info("WASM runner initialized", extra={"log_level": level})
+        self._in_process = wasmtime is not None
+
+        if self._in_process:
+            self._setup_engine()
+        else:
+            self._validate_environment()
+            # Arguments following the invoke expression, per WASM file
+            self._argv_suffixes: Dict[str, Tuple[str, ...]] = {}
 
     def _validate_environment(self) -> None:
         """Validate that required tools are available.
@@ -60,13 +294,350 @@ class WasmRunner:
         Raises:
             WasmEnvironmentError: If wasmtime CLI is not found
         """
-        if not shutil.which(self.CLI_TOOL):
+        cli_path = _find_executable(self.CLI_TOOL)
+        if cli_path is None:
             raise WasmEnvironmentError(
                 f"{self.CLI_TOOL} CLI not found. "
                 f"Install from: https://docs.wasmtime.dev/cli-install.html"
             )
 
-        self.logger.info("Environment validated", extra={"cli_tool": self.CLI_TOOL})
+        # Spawning by absolute path avoids a PATH search on every execution
+        self._argv_prefix = (cli_path, "run", "--invoke")
+        self.logger.info("Environment validated", extra={"cli_tool": cli_path})
+
+    def _setup_engine(self) -> None:
+        """Create the shared engine and linker used by in-process executions.
+
+        Compiling the component and registering the WASI host functions are
+        the expensive steps, so both happen once per process instead of once
+        per call or per runner.
+        """
+        _get_runtime()
+
+        self.logger.info("Engine initialized", extra={"backend": "wasmtime-py"})
+
+    def _resolve_wasm_path(self, wasm_file: str) -> str:
+        """Resolve the WASM file to an absolute path.
+
+        Args:
+            wasm_file: Path to the WASM file
+
+        Returns:
+            Absolute path to the WASM file
+
+        Raises:
+            ConfigurationError: If WASM file doesn't exist
+        """
+        # Ensure absolute path for security
+        wasm_path = _resolve_wasm(wasm_file)
+        if not os.path.isfile(wasm_path):
+            raise ConfigurationError(f"WASM file not found: {wasm_file}")
+        return wasm_path
+
+    def _load_component(self, wasm_file: str) -> Any:
+        """Return the compiled component for a WASM file.
+
+        Compiled components are cached per process and keyed on the file's
+        modification time and size, so warm calls skip compilation entirely.
+
+        Args:
+            wasm_file: Path to the WASM file
+
+        Returns:
+            Compiled wasmtime component
+
+        Raises:
+            ConfigurationError: If WASM file doesn't exist
+        """
+        wasm_path = _resolve_wasm(wasm_file)
+        try:
+            stat = os.stat(wasm_path)
+        except FileNotFoundError:
+            raise ConfigurationError(f"WASM file not found: {wasm_file}")
+
+        return _compile(wasm_path, stat.st_mtime_ns, stat.st_size)
+
+    def _build_request(self, config: ComponentConfig) -> Any:
+        """Build the record passed to the component's exported call function.
+
+        Args:
+            config: Component configuration
+
+        Returns:
+            Record matching the component's request type
+        """
+        payload = wasm_component.Record()
+        setattr(payload, "input", self._encode_input(config))
+
+        request = wasm_component.Record()
+        setattr(request, "application-id", config.application_id)
+        setattr(request, "action-id", config.action_id)
+        setattr(request, "payload", payload)
+
+        return request
+
+    @staticmethod
+    def _encode_input(config: ComponentConfig) -> str:
+        """Serialize the payload input into the JSON string the component expects."""
+        return _dumps(config.payload.get("input", {}))
+
+    @staticmethod
+    def _decode(output: _Output) -> str:
+        """Decode process output, passing through text that is already decoded."""
+        if isinstance(output, bytes):
+            return output.decode("utf-8", errors="replace")
+        return output
+
+    def _run_in_process(self, config: ComponentConfig) -> Tuple[int, _Output, _Output]:
+        """Invoke the component in-process with a fresh store.
+
+        Args:
+            config: Component configuration
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+
+        Raises:
+            ConfigurationError: If WASM file doesn't exist
+            TimeoutError: If execution exceeds the configured timeout
+        """
+        component = self._load_component(config.wasm_file)
+        export = _resolve_export(component, self.EXPORT_INTERFACE, self.EXPORT_NAME)
+        if export is None:
+            raise ConfigurationError(
+                f"Component does not export a '{self.EXPORT_NAME}' function"
+            )
+
+        start_ns = time.perf_counter_ns()
+
+        engine, linker = _get_runtime()
+        store = wasmtime.Store(engine)
+        store.set_wasi(wasmtime.WasiConfig())
+        store.set_wasi_http()
+        # One extra tick so the deadline never fires before the timeout elapses
+        store.set_epoch_deadline(int(config.timeout / _EPOCH_TICK) + 1)
+
+        try:
+            instance = linker.instantiate(store, component)
+            func = instance.get_func(store, export[0])
+            if func is None:
+                raise ConfigurationError(
+                    f"Component export '{self.EXPORT_NAME}' is not a function"
+                )
+            result = func(store, self._build_request(config))
+
+        except wasmtime.ExitTrap as e:
+            return e.code, "", str(e)
+
+        except wasmtime.WasmtimeError as e:
+            if self._elapsed(start_ns) >= config.timeout:
+                raise TimeoutError(str(e)) from e
+            return 1, "", str(e)
+
+        success, text = export[1](result)
+        return (0, text, "") if success else (1, "", text)
+
+    def _run_cli(self, config: ComponentConfig) -> Tuple[int, _Output, _Output]:
+        """Invoke the component through the wasmtime CLI.
+
+        Args:
+            config: Component configuration
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+
+        Raises:
+            ConfigurationError: If WASM file doesn't exist
+            subprocess.TimeoutExpired: If execution exceeds the configured timeout
+        """
+        cmd = self._build_command(config)
+        self._log_command(cmd)
+
+        # Output stays bytes so only the part that is kept gets decoded.
+        # close_fds=False lets CPython spawn via posix_spawn instead of closing
+        # every descriptor in the child. Descriptors are non-inheritable by
+        # default (PEP 446), but any that were made inheritable, by this
+        # process or a library, leak into the wasmtime process.
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+        ) as proc:
+            try:
+                stdout, stderr = self._read_bounded(proc, config.timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+
+        return self._parse_cli_output(proc.returncode, stdout, stderr)
+
+    def _read_bounded(
+        self, proc: "subprocess.Popen[bytes]", timeout: float
+    ) -> Tuple[bytes, bytes]:
+        """Read a process's stdout and stderr, keeping MAX_OUTPUT_SIZE + 1 bytes each.
+
+        Output past the limit is read and discarded so the process can still
+        run to completion, but it is never buffered. The extra byte lets the
+        caller detect that output was truncated.
+
+        Args:
+            proc: Process started with stdout and stderr pipes
+            timeout: Maximum time in seconds to wait for the process
+
+        Returns:
+            Tuple of (stdout, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If the process doesn't finish in time
+        """
+        limit = self.MAX_OUTPUT_SIZE + 1
+
+        if os.name == "nt":
+            # Selectors only support sockets on Windows
+            stdout, stderr = proc.communicate(timeout=timeout)
+            return stdout[:limit], stderr[:limit]
+
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout_fd, stderr_fd = proc.stdout.fileno(), proc.stderr.fileno()
+
+        deadline = time.monotonic() + timeout
+        buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+
+        with selectors.DefaultSelector() as selector:
+            for fd in buffers:
+                selector.register(fd, selectors.EVENT_READ)
+
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(proc.args, timeout)
+
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 64 * 1024)
+                    if not chunk:
+                        selector.unregister(key.fd)
+                        continue
+
+                    buffer = buffers[key.fd]
+                    if len(buffer) < limit:
+                        buffer += chunk[: limit - len(buffer)]
+
+        remaining = deadline - time.monotonic()
+        try:
+            proc.wait(timeout=max(remaining, 0))
+        except subprocess.TimeoutExpired:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+
+        return bytes(buffers[stdout_fd]), bytes(buffers[stderr_fd])
+
+    async def _run_cli_async(
+        self, config: ComponentConfig
+    ) -> Tuple[int, _Output, _Output]:
+        """Invoke the component through the wasmtime CLI using an asyncio subprocess.
+
+        Args:
+            config: Component configuration
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+
+        Raises:
+            ConfigurationError: If WASM file doesn't exist
+            subprocess.TimeoutExpired: If execution exceeds the configured timeout
+        """
+        cmd = self._build_command(config)
+        self._log_command(cmd)
+
+        # Inheritable descriptors leak into the child, see _run_cli
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,
+        )
+
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout_stream, stderr_stream = proc.stdout, proc.stderr
+
+        async def communicate() -> Tuple[bytes, bytes]:
+            stdout, stderr = await asyncio.gather(
+                self._read_bounded_async(stdout_stream),
+                self._read_bounded_async(stderr_stream),
+            )
+            await proc.wait()
+            return stdout, stderr
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                communicate(), timeout=config.timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, config.timeout)
+
+        # communicate() waited for the process, so it has an exit code
+        assert proc.returncode is not None
+        return self._parse_cli_output(proc.returncode, stdout, stderr)
+
+    async def _read_bounded_async(self, stream: asyncio.StreamReader) -> bytes:
+        """Read a stream to the end, keeping at most MAX_OUTPUT_SIZE + 1 bytes.
+
+        Like :meth:`_read_bounded`, output past the limit is read and
+        discarded so the process can run to completion without ever being
+        buffered.
+
+        Args:
+            stream: Output stream of an asyncio subprocess
+
+        Returns:
+            The kept output
+        """
+        limit = self.MAX_OUTPUT_SIZE + 1
+        buffer = bytearray()
+
+        while True:
+            chunk = await stream.read(64 * 1024)
+            if not chunk:
+                return bytes(buffer)
+            if len(buffer) < limit:
+                buffer += chunk[: limit - len(buffer)]
+
+    def _parse_cli_output(
+        self, returncode: int, stdout: bytes, stderr: bytes
+    ) -> Tuple[int, _Output, _Output]:
+        """Unwrap the result printed by ``wasmtime run --invoke``.
+
+        The CLI prints the returned value on the last line of its output and
+        exits successfully even if the component returned ``err``, so the
+        result is unwrapped like the value of an in-process execution.
+
+        Args:
+            returncode: Exit code of the wasmtime process
+            stdout: Output of the wasmtime process
+            stderr: Error output of the wasmtime process
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        if returncode != 0 or len(stdout) > self.MAX_OUTPUT_SIZE:
+            return returncode, stdout, stderr
+
+        lines = self._decode(stdout).strip().splitlines()
+        if not lines:
+            return returncode, stdout, stderr
+
+        success, output = wave.parse_result(lines[-1])
+        return (0, output, stderr) if success else (1, b"", output)
+
+    def _log_command(self, cmd: list[str]) -> None:
+        """Log the wasmtime command with the invoke expression hidden."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        # Log command (sanitized for security)
+        safe_cmd = cmd.copy()
+        safe_cmd[3] = "call({...})"  # Hide sensitive data
+        self.logger.debug("Executing command", extra={"command": safe_cmd})
 
     def _build_invoke_expression(self, config: ComponentConfig) -> str:
         """Build the WAVE invoke expression for the component call.
@@ -77,15 +648,13 @@ class WasmRunner:
         Returns:
             Properly formatted invoke expression
         """
-        # Sanitize payload input to prevent injection
-        payload_input = json.dumps(config.payload.get("input", {}))
-
-        return (
-            f"call({{"
-            f'application-id: "{config.application_id}", '
-            f'action-id: "{config.action_id}", '
-            f"payload: {{input: {payload_input}}}"
-            f"}})"
+        # Quote the JSON input as a WAVE string literal to prevent injection
+        payload_input = wave.quote(self._encode_input(config))
+
+        return self.INVOKE_TEMPLATE.format(
+            application_id=config.application_id,
+            action_id=config.action_id,
+            payload_input=payload_input,
         )
 
     def _build_command(self, config: ComponentConfig) -> list[str]:
@@ -100,49 +669,173 @@ class WasmRunner:
         Raises:
             ConfigurationError: If WASM file doesn't exist
         """
-        wasm_path = Path(config.wasm_file)
-        if not wasm_path.exists():
-            raise ConfigurationError(f"WASM file not found: {config.wasm_file}")
+        invoke_expr = self._build_invoke_expression(config)
 
-        # Ensure absolute path for security
-        wasm_path = wasm_path.resolve()
+        return [*self._argv_prefix, invoke_expr, *self._argv_suffix(config.wasm_file)]
 
-        invoke_expr = self._build_invoke_expression(config)
+    def _argv_suffix(self, wasm_file: str) -> Tuple[str, ...]:
+        """Return the arguments following the invoke expression for a WASM file.
+
+        Only the invoke expression differs between calls, so the flags and the
+        component path are built once per WASM file and reused for the
+        lifetime of the runner.
+
+        Args:
+            wasm_file: Path to the WASM file
+
+        Returns:
+            Tuple of command arguments
+
+        Raises:
+            ConfigurationError: If WASM file doesn't exist
+        """
+        suffix = self._argv_suffixes.get(wasm_file)
+        if suffix is not None:
+            return suffix
+
+        wasm_path = self._resolve_wasm_path(wasm_file)
+
+        cache_flags: Tuple[str, ...] = ()
+        if self.CACHE_CONFIG is not None:
+            cache_flags = ("-C", f"cache-config={self.CACHE_CONFIG}")
+
+        suffix = (*self.CLI_FLAGS, *cache_flags, wasm_path)
+        self._argv_suffixes[wasm_file] = suffix
+        return suffix
+
+    def _log_start(self, config: ComponentConfig) -> None:
+        """Log the start of a component execution."""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Starting component execution",
+                extra={
+                    "application_id": config.application_id,
+                    "action_id": config.action_id,
+                    "timeout": config.timeout,
+                },
+            )
+
+    @staticmethod
+    def _elapsed(start_ns: int) -> float:
+        """Return the seconds elapsed since a perf_counter_ns() timestamp."""
+        return (time.perf_counter_ns() - start_ns) / 1e9
+
+    def _build_result(
+        self,
+        config: ComponentConfig,
+        returncode: int,
+        stdout: _Output,
+        stderr: _Output,
+        execution_time: float,
+    ) -> ExecutionResult:
+        """Build the execution result from the component's exit code and output.
+
+        Args:
+            config: Component configuration
+            returncode: Exit code of the execution
+            stdout: Output produced by the component
+            stderr: Error output produced by the component
+            execution_time: Elapsed time in seconds
 
-        return [
-            self.CLI_TOOL,
-            "run",
-            "--invoke",
-            invoke_expr,
-            *self.CLI_FLAGS,
-            str(wasm_path),
-        ]
-
-    @contextmanager
-    def _execution_context(self, config: ComponentConfig):
-        """Context manager for safe execution tracking."""
-
-        start_time = time.time()
-        self.logger.info(
-            "Starting component execution",
+        Returns:
+            ExecutionResult with success status and output
+        """
+        # Validate output size before decoding so oversized output is never
+        # decoded in full
+        if len(stdout) > self.MAX_OUTPUT_SIZE:
+            self.logger.warning("Output truncated due to size limit")
+            output = self._decode(stdout[: self.MAX_OUTPUT_SIZE]) + "... (truncated)"
+        else:
+            output = self._decode(stdout).strip()
+
+        if returncode == 0:
+            final_output = output or "Success (no output)"
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Component executed successfully",
+                    extra={
+                        "action_id": config.action_id,
+                        "execution_time": f"{execution_time:.3f}s",
+                    },
+                )
+            return ExecutionResult(
+                success=True,
+                output=final_output,
+                exit_code=returncode,
+                execution_time=execution_time,
+            )
+
+        error_msg = self._decode(stderr).strip() or "Unknown error"
+        self.logger.error(
+            "Component execution failed",
             extra={
-                "application_id": config.application_id,
                 "action_id": config.action_id,
-                "timeout": config.timeout,
+                "exit_code": returncode,
+                "error": error_msg,
             },
         )
+        return ExecutionResult(
+            success=False,
+            output=f"Execution failed: {error_msg}",
+            exit_code=returncode,
+            execution_time=execution_time,
+            error_type="execution_failure",
+        )
 
-        try:
-            yield start_time
-        finally:
-            execution_time = time.time() - start_time
-            self.logger.info(
-                "Execution completed",
+    def _error_result(
+        self, config: ComponentConfig, error: Exception, execution_time: float
+    ) -> ExecutionResult:
+        """Convert an error raised while executing a component into a result.
+
+        Must be called while handling ``error``.
+
+        Args:
+            config: Component configuration
+            error: The exception raised during execution
+            execution_time: Elapsed time in seconds
+
+        Returns:
+            ExecutionResult describing the failure
+
+        Raises:
+            ExecutionError: If the error is unexpected
+        """
+        if isinstance(error, (subprocess.TimeoutExpired, TimeoutError)):
+            error_msg = f"Execution timed out after {config.timeout}s"
+            self.logger.error(
+                "Component execution timeout",
+                extra={"action_id": config.action_id, "timeout": config.timeout},
+            )
+            return ExecutionResult(
+                success=False,
+                output=error_msg,
+                execution_time=execution_time,
+                error_type="timeout",
+            )
+
+        if isinstance(error, (OSError, PermissionError)):
+            error_msg = f"System error: {str(error)}"
+            self.logger.error(
+                "System error during execution",
                 extra={
-                    "execution_time": f"{execution_time:.3f}s",
                     "action_id": config.action_id,
+                    "error": str(error),
+                    "error_type": type(error).__name__,
                 },
             )
+            return ExecutionResult(
+                success=False,
+                output=error_msg,
+                execution_time=execution_time,
+                error_type="system_error",
+            )
+
+        error_msg = f"Unexpected error: {str(error)}"
+        self.logger.exception(
+            "Unexpected error during execution",
+            extra={"action_id": config.action_id},
+        )
+        raise ExecutionError(error_msg) from error
 
     def execute_component(self, config: ComponentConfig) -> ExecutionResult:
         """Execute a WASM component with comprehensive error handling.
@@ -156,107 +849,50 @@ class WasmRunner:
         Raises:
             ExecutionError: If execution fails unexpectedly
         """
-        with self._execution_context(config) as start_time:
-            try:
-                cmd = self._build_command(config)
-
-                # Log command (sanitized for security)
-                safe_cmd = cmd.copy()
-                safe_cmd[3] = "call({...})"  # Hide sensitive data
-                self.logger.debug("Executing command", extra={"command": safe_cmd})
-
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=config.timeout,
-                    check=False,  # Don't raise on non-zero exit
-                )
+        start_ns = time.perf_counter_ns()
+        self._log_start(config)
 
-                execution_time = time.time() - start_time
-
-                # Validate output size
-                if len(result.stdout) > self.MAX_OUTPUT_SIZE:
-                    self.logger.warning("Output truncated due to size limit")
-                    output = result.stdout[: self.MAX_OUTPUT_SIZE] + "... (truncated)"
-                else:
-                    output = result.stdout.strip()
-
-                if result.returncode == 0:
-                    final_output = output if output else "Success (no output)"
-                    self.logger.info(
-                        "Component executed successfully",
-                        extra={
-                            "action_id": config.action_id,
-                            "execution_time": f"{execution_time:.3f}s",
-                        },
-                    )
-                    return ExecutionResult(
-                        success=True,
-                        output=final_output,
-                        exit_code=result.returncode,
-                        execution_time=execution_time,
-                    )
-                else:
-                    error_msg = (
-                        result.stderr.strip() if result.stderr else "Unknown error"
-                    )
-                    self.logger.error(
-                        "Component execution failed",
-                        extra={
-                            "action_id": config.action_id,
-                            "exit_code": result.returncode,
-                            "error": error_msg,
-                        },
-                    )
-                    return ExecutionResult(
-                        success=False,
-                        output=f"Execution failed: {error_msg}",
-                        exit_code=result.returncode,
-                        execution_time=execution_time,
-                        error_type="execution_failure",
-                    )
+        try:
+            if self._in_process:
+                returncode, stdout, stderr = self._run_in_process(config)
+            else:
+                returncode, stdout, stderr = self._run_cli(config)
+        except Exception as e:
+            return self._error_result(config, e, self._elapsed(start_ns))
 
-            except subprocess.TimeoutExpired:
-                execution_time = time.time() - start_time
-                error_msg = f"Execution timed out after {config.timeout}s"
-                self.logger.error(
-                    "Component execution timeout",
-                    extra={"action_id": config.action_id, "timeout": config.timeout},
-                )
-                return ExecutionResult(
-                    success=False,
-                    output=error_msg,
-                    execution_time=execution_time,
-                    error_type="timeout",
-                )
+        return self._build_result(
+            config, returncode, stdout, stderr, self._elapsed(start_ns)
+        )
 
-            except (OSError, PermissionError) as e:
-                execution_time = time.time() - start_time
-                error_msg = f"System error: {str(e)}"
-                self.logger.error(
-                    "System error during execution",
-                    extra={
-                        "action_id": config.action_id,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                    },
-                )
-                return ExecutionResult(
-                    success=False,
-                    output=error_msg,
-                    execution_time=execution_time,
-                    error_type="system_error",
-                )
+    async def execute_component_async(self, config: ComponentConfig) -> ExecutionResult:
+        """Execute a WASM component without blocking the event loop.
 
-            except Exception as e:
-                execution_time = time.time() - start_time
-                error_msg = f"Unexpected error: {str(e)}"
-                self.logger.exception(
-                    "Unexpected error during execution",
-                    extra={"action_id": config.action_id},
-                )
-                raise ExecutionError(error_msg) from e
+        In-process executions run in a worker thread and CLI executions use an
+        asyncio subprocess, so many components can execute concurrently.
+
+        Args:
+            config: Component configuration
+
+        Returns:
+            ExecutionResult with success status and output
+
+        Raises:
+            ExecutionError: If execution fails unexpectedly
+        """
+        if self._in_process:
+            return await asyncio.to_thread(self.execute_component, config)
+
+        start_ns = time.perf_counter_ns()
+        self._log_start(config)
+
+        try:
+            returncode, stdout, stderr = await self._run_cli_async(config)
+        except Exception as e:
+            return self._error_result(config, e, self._elapsed(start_ns))
+
+        return self._build_result(
+            config, returncode, stdout, stderr, self._elapsed(start_ns)
+        )
 
 
 class BettyBlocksRunner:
@@ -280,6 +916,7 @@ class BettyBlocksRunner:
         wasm_file: str = "actions.wasm",
         timeout: int = 30,
         log_level: str = "INFO",
+        max_workers: int = 4,
     ) -> None:
         """Initialize the Betty Blocks runner.
 
@@ -288,20 +925,41 @@ class BettyBlocksRunner:
             action_id: Unique identifier for the action
             wasm_file: Path to the WASM file
             timeout: Maximum execution time in seconds
-            log_level: Logging level
+            log_level: Logging level, applied process-wide to every runner
+            max_workers: Maximum number of concurrent executions in run_many
+                and arun_batch
 
         Raises:
+            ConfigurationError: If the WASM file doesn't exist or max_workers
+                is not a positive integer
             WasmEnvironmentError: If required tools are not available
         """
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ConfigurationError("max_workers must be a positive integer")
+
+        # Resolve once so every execution receives an absolute path; the
+        # file is checked here so a missing one fails right away
+        wasm_path = _resolve_wasm(wasm_file)
+        if not os.path.isfile(wasm_path):
+            raise ConfigurationError(f"WASM file not found: {wasm_file}")
+        wasm_file = wasm_path
+
         self._wasm_runner = WasmRunner(log_level)
         self._application_id = application_id
         self._action_id = action_id
         self._wasm_file = wasm_file
         self._timeout = timeout
+        # IDs of the last configuration that passed validation
+        self._validated_ids: Optional[Tuple[str, str]] = None
+        self._max_workers = max_workers
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
 
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger = logger
 
-    def __call__(self, input_data: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
+    def __call__(
+        self, input_data: Optional[Mapping[str, Any]] = None
+    ) -> Tuple[bool, str]:
         """Make the runner callable directly with input data.
 
         Args:
@@ -319,13 +977,79 @@ class BettyBlocksRunner:
                 "to use callable interface"
             )
 
-        return self.run_single(self._application_id, self._action_id, input_data)
+        config = self.create_config(self._application_id, self._action_id, input_data)
+        result = self._wasm_runner.execute_component(config)
+        return result.success, result.output
+
+    def run_batch(
+        self, inputs: Iterable[Optional[Mapping[str, Any]]]
+    ) -> List[Tuple[bool, str]]:
+        """Run the bound component once for every input.
+
+        The engine, linker and compiled component are shared across the
+        batch, so each item only pays for a fresh store and instance.
+
+        Args:
+            inputs: Input data for each component invocation
+
+        Returns:
+            List of (success, result_message) tuples in input order
+
+        Raises:
+            ConfigurationError: If application_id or action_id not set
+            ExecutionError: If execution fails unexpectedly
+        """
+        return [self(input_data) for input_data in inputs]
+
+    def run_many(
+        self, inputs: Iterable[Optional[Mapping[str, Any]]]
+    ) -> List[Tuple[bool, str]]:
+        """Run the bound component for every input on a bounded worker pool.
+
+        At most ``max_workers`` executions run at once. The pool's threads are
+        reused across calls and are released by ``close``.
+
+        Args:
+            inputs: Input data for each component invocation
+
+        Returns:
+            List of (success, result_message) tuples in input order
+
+        Raises:
+            ConfigurationError: If application_id or action_id not set
+            ExecutionError: If execution fails unexpectedly
+        """
+        if self._application_id is None or self._action_id is None:
+            raise ConfigurationError(
+                "application_id and action_id must be set in constructor "
+                "to run batches"
+            )
+
+        return list(self._get_pool().map(self, inputs))
+
+    def close(self) -> None:
+        """Shut down the worker pool used by run_many, if it was started."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="betty-blocks-runner",
+                )
+            return self._pool
 
     def create_config(
         self,
         application_id: str,
         action_id: str,
-        input_data: Optional[Dict[str, Any]] = None,
+        input_data: Optional[Mapping[str, Any]] = None,
     ) -> ComponentConfig:
         """Create a validated component configuration.
 
@@ -340,31 +1064,66 @@ class BettyBlocksRunner:
         Raises:
             ConfigurationError: If configuration is invalid
         """
+        sanitized_input = self._sanitize_input(input_data)
+
+        # Only the payload changes between calls with the same IDs, and it is
+        # always a dictionary here, so validation only has to run once
+        if (application_id, action_id) == self._validated_ids:
+            return ComponentConfig.unchecked(
+                application_id=application_id,
+                action_id=action_id,
+                payload={"input": sanitized_input},
+                wasm_file=self._wasm_file,
+                timeout=self._timeout,
+            )
+
+        config = ComponentConfig(
+            application_id=application_id,
+            action_id=action_id,
+            payload={"input": sanitized_input},
+            wasm_file=self._wasm_file,
+            timeout=self._timeout,
+        )
+        self._validated_ids = (application_id, action_id)
+        return config
+
+    @staticmethod
+    def _sanitize_input(input_data: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Remove None values and non-string keys from component input.
+
+        A dictionary that is already clean is returned as-is without a copy.
+
+        Args:
+            input_data: Input data for the component
+
+        Returns:
+            Sanitized input dictionary
+
+        Raises:
+            ConfigurationError: If input_data is not a mapping
+        """
         if input_data is None:
-            input_data = {}
+            return {}
 
         # Validate input data structure
-        if not isinstance(input_data, dict):
+        if not isinstance(input_data, collections.abc.Mapping):
             raise ConfigurationError("input_data must be a valid dictionary")
 
-        # Sanitize input data (remove None values, validate types)
-        sanitized_input = {
+        if not input_data:
+            return {}
+        if isinstance(input_data, dict) and all(
+            v is not None and isinstance(k, str) for k, v in input_data.items()
+        ):
+            return input_data
+        return {
             k: v for k, v in input_data.items() if v is not None and isinstance(k, str)
         }
 
-        return ComponentConfig(
-            application_id=application_id,
-            action_id=action_id,
-            payload={"input": json.dumps(sanitized_input)},
-            wasm_file=self._wasm_file,
-            timeout=self._timeout,
-        )
-
     def run_single(
         self,
         application_id: str,
         action_id: str,
-        input_data: Optional[Dict[str, Any]] = None,
+        input_data: Optional[Mapping[str, Any]] = None,
     ) -> Tuple[bool, str]:
         """Run a single Betty Blocks component.
 
@@ -391,3 +1150,39 @@ class BettyBlocksRunner:
         except Exception as e:
             self.logger.exception("Unexpected error in run_single")
             raise ExecutionError(f"Unexpected error: {str(e)}") from e
+
+    async def arun_batch(
+        self, inputs: Iterable[Optional[Mapping[str, Any]]]
+    ) -> List[Tuple[bool, str]]:
+        """Run the bound component for every input concurrently.
+
+        At most ``max_workers`` executions are in flight at any time, the same
+        bound that applies to run_many.
+
+        Args:
+            inputs: Input data for each component invocation
+
+        Returns:
+            List of (success, result_message) tuples in input order
+
+        Raises:
+            ConfigurationError: If application_id or action_id not set
+            ExecutionError: If execution fails unexpectedly
+        """
+        if self._application_id is None or self._action_id is None:
+            raise ConfigurationError(
+                "application_id and action_id must be set in constructor "
+                "to run batches"
+            )
+
+        application_id, action_id = self._application_id, self._action_id
+
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def run(input_data: Optional[Mapping[str, Any]]) -> Tuple[bool, str]:
+            async with semaphore:
+                config = self.create_config(application_id, action_id, input_data)
+                result = await self._wasm_runner.execute_component_async(config)
+                return result.success, result.output
+
+        return list(await asyncio.gather(*(run(input_data) for input_data in inputs)))
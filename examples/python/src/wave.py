@@ -0,0 +1,280 @@
+"""Conversion between component values and their WAVE text representation.
+
+The wasmtime CLI prints the value returned by ``--invoke`` in the WAVE
+format. In-process executions render their values the same way, so both
+backends report identical output for the same component.
+"""
+
+import math
+import re
+import struct
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from wasmtime import component as wasm_component  # type: ignore
+except ImportError:  # Only needed to format values from in-process executions
+    wasm_component = None  # type: ignore[assignment]
+
+Formatter = Callable[[Any], str]
+ResultFormatter = Callable[[Any], Tuple[bool, str]]
+
+
+def _escape_table(delimiter: str) -> Dict[int, str]:
+    """Build a str.translate table escaping a WAVE string or char literal."""
+    table = {code: f"\\u{{{code:x}}}" for code in (*range(0x20), 0x7F)}
+    table.update(
+        {
+            ord("\\"): "\\\\",
+            ord(delimiter): f"\\{delimiter}",
+            ord("\n"): "\\n",
+            ord("\r"): "\\r",
+            ord("\t"): "\\t",
+        }
+    )
+    return table
+
+
+_STRING_ESCAPES = _escape_table('"')
+_CHAR_ESCAPES = _escape_table("'")
+_UNESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+_ESCAPE_PATTERN = re.compile(r"\\(u\{[0-9a-fA-F]+\}|.)", re.DOTALL)
+_UNESCAPED_QUOTE = re.compile(r'(?:^|[^\\])(?:\\\\)*"')
+
+
+def quote(text: str) -> str:
+    """Render text as a WAVE string literal."""
+    return f'"{text.translate(_STRING_ESCAPES)}"'
+
+
+def unquote(literal: str) -> Optional[str]:
+    """Decode a WAVE string literal.
+
+    Returns ``None`` if ``literal`` is not a single string literal.
+    """
+    if len(literal) < 2 or literal[0] != '"' or literal[-1] != '"':
+        return None
+
+    body = literal[1:-1]
+    if _UNESCAPED_QUOTE.search(body):
+        return None
+
+    def unescape(match: "re.Match[str]") -> str:
+        escape = match.group(1)
+        if escape.startswith("u{"):
+            return chr(int(escape[2:-1], 16))
+        return _UNESCAPES.get(escape, escape)
+
+    return _ESCAPE_PATTERN.sub(unescape, body)
+
+
+def parse_result(text: str) -> Tuple[bool, str]:
+    """Split the printed result of a component call into status and output.
+
+    ``ok(...)`` and ``err(...)`` are unwrapped, and a string payload is
+    decoded, exactly like :func:`result_formatter` renders the value returned
+    by an in-process call. Any other output counts as success and is
+    returned unchanged.
+
+    Args:
+        text: Result printed by ``wasmtime run --invoke``
+
+    Returns:
+        Tuple of (success, output)
+    """
+    for tag, success in (("ok", True), ("err", False)):
+        if text == tag:
+            return success, ""
+        if text.startswith(f"{tag}(") and text.endswith(")"):
+            text = text[len(tag) + 1 : -1]
+            break
+    else:
+        success = True
+
+    decoded = unquote(text)
+    return success, text if decoded is None else decoded
+
+
+def _shortest_f32(value: float) -> str:
+    """Return the shortest decimal that reads back as the same 32-bit float."""
+    single = struct.pack("<f", value)
+    for precision in range(1, 10):
+        text = f"{value:.{precision}g}"
+        try:
+            if struct.pack("<f", float(text)) == single:
+                return text
+        except OverflowError:
+            pass  # Rounded past the largest 32-bit float
+    return repr(value)
+
+
+def _format_float(value: float, single: bool = False) -> str:
+    """Render a float the way the wasmtime CLI prints it.
+
+    Uses the shortest decimal that round-trips at the value's precision,
+    without exponent notation (``10000000000000000`` rather than ``1e+16``),
+    and spells out the values WAVE has keywords for.
+    """
+    if math.isnan(value):
+        return "nan"
+    if math.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    text = _shortest_f32(value) if single else repr(value)
+    return format(Decimal(text).normalize(), "f")
+
+
+def _variant_cases(ty: Any) -> List[Tuple[str, Any]]:
+    """Return the (name, payload type) cases of a variant, option or result."""
+    if isinstance(ty, wasm_component.OptionType):
+        return [("none", None), ("some", ty.payload)]
+    if isinstance(ty, wasm_component.ResultType):
+        return [("ok", ty.ok), ("err", ty.err)]
+    return ty.cases
+
+
+def _case_matcher(cases: List[Tuple[str, Any]]) -> Callable[[Any], Tuple[str, Any]]:
+    """Build a function returning the (case name, payload) of a variant value.
+
+    wasmtime only wraps values in a ``Variant`` when the Python types of the
+    cases overlap; otherwise the bare payload is returned and the case has to
+    be recovered from its type, the same way wasmtime does when lowering.
+    """
+    seen: set = set()
+    classes = []
+    tagged = False
+    for _, case_ty in cases:
+        case: set = set()
+        if case_ty is None:
+            case.add(object)
+        else:
+            case_ty.add_classes(case)
+        tagged = tagged or bool(case & seen)
+        seen |= case
+        classes.append(tuple(case))
+
+    if tagged:
+        return lambda value: (value.tag, value.payload)
+
+    def match(value: Any) -> Tuple[str, Any]:
+        for (name, case_ty), case_classes in zip(cases, classes):
+            if case_ty is None:
+                if value is None:
+                    return name, None
+            elif isinstance(value, case_classes):
+                return name, value
+        raise ValueError(f"Value does not match any case: {value!r}")
+
+    return match
+
+
+def formatter(ty: Any) -> Formatter:
+    """Build a function rendering values of a component type as WAVE text.
+
+    Args:
+        ty: wasmtime component value type
+
+    Returns:
+        Function converting a value of this type to WAVE text
+    """
+    wc = wasm_component
+
+    if isinstance(ty, wc.String):
+        return quote
+    if isinstance(ty, wc.Char):
+        return lambda value: f"'{value.translate(_CHAR_ESCAPES)}'"
+    if isinstance(ty, wc.Bool):
+        return lambda value: "true" if value else "false"
+    if isinstance(ty, wc.F32):
+        return lambda value: _format_float(value, single=True)
+    if isinstance(ty, wc.F64):
+        return _format_float
+    if isinstance(ty, (wc.S8, wc.S16, wc.S32, wc.S64, wc.U8, wc.U16, wc.U32, wc.U64)):
+        return str
+    if isinstance(ty, wc.EnumType):
+        return str
+
+    if isinstance(ty, wc.ListType):
+        item = formatter(ty.element)
+        return lambda value: "[" + ", ".join(map(item, value)) + "]"
+
+    if isinstance(ty, wc.TupleType):
+        items = [formatter(element) for element in ty.elements]
+        return lambda value: "(" + ", ".join(f(v) for f, v in zip(items, value)) + ")"
+
+    if isinstance(ty, wc.FlagsType):
+        names = ty.names
+        return lambda value: "{" + ", ".join(n for n in names if n in value) + "}"
+
+    if isinstance(ty, wc.RecordType):
+        fields = []
+        for name, field_ty in ty.fields:
+            # Option fields that are none are left out, like the CLI does
+            is_none = None
+            if isinstance(field_ty, wc.OptionType):
+                match = _case_matcher(_variant_cases(field_ty))
+                is_none = lambda value, match=match: match(value)[0] == "none"
+            fields.append((name, formatter(field_ty), is_none))
+
+        def format_record(value: Any) -> str:
+            parts = []
+            for name, format_field, is_none in fields:
+                field = getattr(value, name)
+                if is_none is None or not is_none(field):
+                    parts.append(f"{name}: {format_field(field)}")
+            return "{" + ", ".join(parts) + "}" if parts else "{:}"
+
+        return format_record
+
+    if isinstance(ty, (wc.VariantType, wc.OptionType, wc.ResultType)):
+        cases = _variant_cases(ty)
+        match = _case_matcher(cases)
+        payloads = {
+            name: None if case_ty is None else formatter(case_ty)
+            for name, case_ty in cases
+        }
+
+        def format_variant(value: Any) -> str:
+            name, payload = match(value)
+            format_payload = payloads[name]
+            if format_payload is None:
+                return name
+            return f"{name}({format_payload(payload)})"
+
+        return format_variant
+
+    return repr
+
+
+def result_formatter(ty: Any) -> ResultFormatter:
+    """Build a function converting the value returned by a call into a result.
+
+    A ``result`` is unwrapped into its payload and reports failure for
+    ``err``. A string payload is returned as-is, any other payload as WAVE
+    text, matching :func:`parse_result` for the CLI output.
+
+    Args:
+        ty: Result type of the called function, or ``None`` if it has none
+
+    Returns:
+        Function converting a returned value to a tuple of (success, output)
+    """
+
+    def payload_formatter(payload_ty: Any) -> Formatter:
+        if payload_ty is None:
+            return lambda value: ""
+        if isinstance(payload_ty, wasm_component.String):
+            return lambda value: value
+        return formatter(payload_ty)
+
+    if isinstance(ty, wasm_component.ResultType):
+        match = _case_matcher(_variant_cases(ty))
+        formatters = {"ok": payload_formatter(ty.ok), "err": payload_formatter(ty.err)}
+
+        def format_result(value: Any) -> Tuple[bool, str]:
+            tag, payload = match(value)
+            return tag == "ok", formatters[tag](payload)
+
+        return format_result
+
+    format_value = payload_formatter(ty)
+    return lambda value: (True, format_value(value))
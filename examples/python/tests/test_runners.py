@@ -0,0 +1,329 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import BettyBlocksRunner, ComponentConfig, ConfigurationError, runners, wave
+
+try:
+    import wasmtime
+except ImportError:
+    wasmtime = None
+
+APPLICATION_ID = "be3c7dec126547c5bdb1870ca9d86778"
+ACTION_ID = "7c33a2b6355545338b536a4863486d97"
+
+# Component whose call function returns the payload input as the ok or err
+# value. The payload layout of `string` and `record {result: string}` is the
+# same, so only the declared result type changes.
+STRING_STORE = """
+      (i32.store (i32.const 20) (local.get 4))
+      (i32.store (i32.const 24) (local.get 5))"""
+COMPONENT_WAT = """
+(component
+  (core module $m
+    (memory (export "memory") 1)
+    (global $bump (mut i32) (i32.const 1024))
+    (func (export "realloc") (param i32 i32 i32 i32) (result i32)
+      (local $p i32)
+      global.get $bump
+      local.set $p
+      global.get $bump
+      local.get 3
+      i32.add
+      global.set $bump
+      local.get $p)
+    (func (export "call") (param i32 i32 i32 i32 i32 i32) (result i32)
+      (i32.store8 (i32.const 16) (i32.const {discriminant})){store}
+      i32.const 16))
+  (core instance $i (instantiate $m))
+  {types}
+  (func $call (param "request" $request) (result (result $output (error string)))
+    (canon lift (core func $i "call")
+      (memory $i "memory") (realloc (func $i "realloc"))))
+  {export}
+)
+"""
+
+TYPES = """
+  (type $payload (record (field "input" string)))
+  (type $request (record
+    (field "application-id" string)
+    (field "action-id" string)
+    (field "payload" $payload)))
+  (type $output {output})
+"""
+
+# Types of root exports have to be exported themselves
+ROOT_TYPES = """
+  (type $payload' (record (field "input" string)))
+  (export $payload "payload" (type $payload'))
+  (type $request' (record
+    (field "application-id" string)
+    (field "action-id" string)
+    (field "payload" $payload)))
+  (export $request "request" (type $request'))
+  (type $output' {output})
+  (export $output "output" (type $output'))
+"""
+
+INTERFACE_EXPORT = """
+  (instance $actions
+    (export "payload" (type $payload))
+    (export "request" (type $request))
+    (export "output" (type $output))
+    (export "call" (func $call)))
+  (export "betty-blocks:custom/actions@0.1.0" (instance $actions))
+"""
+
+RECORD_OUTPUT = '(record (field "result" string))'
+
+ROOT_EXPORT = '(export "call" (func $call))'
+
+# Stores numbers the CLI prints differently from Python's repr: the f32
+# nearest to 0.1 and an f64 that repr puts in exponent notation.
+NUMBER_OUTPUT = '(record (field "score" f32) (field "total" f64))'
+
+NUMBER_STORE = """
+      (f32.store (i32.const 24) (f32.const 0.1))
+      (f64.store (i32.const 32) (f64.const 1e16))"""
+
+
+@unittest.skipIf(wasmtime is None, "wasmtime-py is not installed")
+class InProcessRunnerTest(unittest.TestCase):
+    def run_component(
+        self,
+        input_data,
+        output="string",
+        export=INTERFACE_EXPORT,
+        err=False,
+        store=STRING_STORE,
+    ):
+        types = TYPES if export == INTERFACE_EXPORT else ROOT_TYPES
+        wat = (
+            COMPONENT_WAT.replace("{types}", types)
+            .replace("{export}", export)
+            .replace("{store}", store)
+            .replace("{discriminant}", "1" if err else "0")
+            .replace("{output}", output)
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            wasm_file = Path(tmp) / "actions.wasm"
+            wasm_file.write_bytes(wasmtime.wat2wasm(wat))
+            runner = BettyBlocksRunner(
+                APPLICATION_ID, ACTION_ID, wasm_file=str(wasm_file), log_level="ERROR"
+            )
+            return runner(input_data)
+
+    def test_call_exported_from_actions_interface(self):
+        result = self.run_component({"score": 21.3})
+        self.assertEqual(result, (True, '{"score":21.3}'))
+
+    def test_call_exported_from_root(self):
+        result = self.run_component({"score": 1}, RECORD_OUTPUT, export=ROOT_EXPORT)
+        self.assertEqual(result, (True, '{result: "{\\"score\\":1}"}'))
+
+    def test_err_result_is_a_failure(self):
+        result = self.run_component({"score": 1}, RECORD_OUTPUT, err=True)
+        self.assertEqual(result, (False, 'Execution failed: {"score":1}'))
+
+    def test_record_output_matches_cli_rendering(self):
+        success, output = self.run_component({"a": "b"}, RECORD_OUTPUT)
+        self.assertTrue(success)
+        self.assertEqual(output, '{result: "{\\"a\\":\\"b\\"}"}')
+        self.assertEqual(wave.parse_result(f"ok({output})"), (True, output))
+
+    def test_number_output_matches_cli_rendering(self):
+        result = self.run_component({}, NUMBER_OUTPUT, store=NUMBER_STORE)
+        self.assertEqual(result, (True, "{score: 0.1, total: 10000000000000000}"))
+
+
+# Stand-in for the wasmtime CLI. It answers `run --invoke` with the payload
+# input as the ok value, unless the input asks for another behaviour.
+CLI_STUB = """#!{python}
+import os, sys, time
+
+expression = sys.argv[3]
+stub_dir = os.environ["CLI_STUB_DIR"]
+with open(os.path.join(stub_dir, "pids"), "a") as pids:
+    pids.write(f"{{os.getpid()}}\\n")
+
+if "flood-stdout" in expression:
+    sys.stdout.write("x" * 256 * 1024 + '\\nok("y")\\n')
+elif "flood-stderr" in expression:
+    sys.stderr.write("e" * 256 * 1024)
+    sys.exit(3)
+elif "sleep" in expression:
+    time.sleep(10)
+elif "fail" in expression:
+    print('err("bad input")')
+else:
+    # Record how many stubs are running at once
+    running = os.path.join(stub_dir, "running")
+    marker = os.path.join(running, str(os.getpid()))
+    open(marker, "w").close()
+    time.sleep(0.1)
+    with open(os.path.join(stub_dir, "counts"), "a") as counts:
+        counts.write(f"{{len(os.listdir(running))}}\\n")
+    os.remove(marker)
+    print(f"ok({{expression[expression.index('input: ') + 7 : -3]}})")
+"""
+
+
+class CliRunnerTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.stub_dir = Path(tmp.name)
+        (self.stub_dir / "running").mkdir()
+
+        cli = self.stub_dir / "wasmtime"
+        cli.write_text(CLI_STUB.format(python=sys.executable))
+        cli.chmod(0o755)
+        wasm_file = self.stub_dir / "actions.wasm"
+        wasm_file.write_bytes(b"")
+
+        path = f"{self.stub_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+        env = {"PATH": path, "CLI_STUB_DIR": str(self.stub_dir)}
+        for patcher in (
+            mock.patch.dict(os.environ, env),
+            mock.patch.object(runners.WasmRunner, "MAX_OUTPUT_SIZE", 1024),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        runners._executables.clear()
+        self.addCleanup(runners._executables.clear)
+
+        # Without wasmtime-py the runner falls back to the CLI
+        with mock.patch.object(runners, "wasmtime", None):
+            self.runner = BettyBlocksRunner(
+                APPLICATION_ID,
+                ACTION_ID,
+                wasm_file=str(wasm_file),
+                timeout=1,
+                log_level="CRITICAL",
+                max_workers=2,
+            )
+        self.addCleanup(self.runner.close)
+
+    def pids(self):
+        return [int(pid) for pid in (self.stub_dir / "pids").read_text().split()]
+
+    def max_concurrency(self):
+        return max(map(int, (self.stub_dir / "counts").read_text().split()))
+
+    def test_missing_cli_is_looked_up_again(self):
+        runners._executables.clear()
+        with mock.patch.dict(os.environ, {"PATH": ""}):
+            self.assertIsNone(runners._find_executable("wasmtime"))
+        self.assertEqual(
+            runners._find_executable("wasmtime"), str(self.stub_dir / "wasmtime")
+        )
+
+    def test_ok_result_is_unwrapped(self):
+        self.assertEqual(self.runner({"a": "b"}), (True, '{"a":"b"}'))
+
+    def test_err_result_is_a_failure(self):
+        self.assertEqual(
+            self.runner({"mode": "fail"}), (False, "Execution failed: bad input")
+        )
+
+    def test_oversized_stdout_is_truncated(self):
+        success, output = self.runner({"mode": "flood-stdout"})
+        self.assertTrue(success)
+        self.assertEqual(output, "x" * 1024 + "... (truncated)")
+
+    def test_oversized_stderr_is_bounded(self):
+        success, output = self.runner({"mode": "flood-stderr"})
+        self.assertFalse(success)
+        self.assertTrue(output.startswith("Execution failed: eee"))
+        self.assertLessEqual(len(output), len("Execution failed: ") + 1025)
+
+    def test_timeout_kills_the_process(self):
+        result = self.runner({"mode": "sleep"})
+        self.assertEqual(result, (False, "Execution timed out after 1s"))
+        with self.assertRaises(ProcessLookupError):
+            os.kill(self.pids()[0], 0)
+
+    def test_async_timeout_kills_the_process(self):
+        results = asyncio.run(self.runner.arun_batch([{"mode": "sleep"}]))
+        self.assertEqual(results, [(False, "Execution timed out after 1s")])
+        with self.assertRaises(ProcessLookupError):
+            os.kill(self.pids()[0], 0)
+
+    def test_async_output_is_parsed_and_truncated(self):
+        inputs = [{"mode": "fail"}, {"mode": "flood-stdout"}]
+        results = asyncio.run(self.runner.arun_batch(inputs))
+        self.assertEqual(
+            results,
+            [
+                (False, "Execution failed: bad input"),
+                (True, "x" * 1024 + "... (truncated)"),
+            ],
+        )
+
+    def test_run_many_keeps_order_within_max_workers(self):
+        inputs = [{"index": index} for index in range(6)]
+        results = self.runner.run_many(inputs)
+        self.assertEqual(results, [(True, f'{{"index":{i}}}') for i in range(6)])
+        self.assertLessEqual(self.max_concurrency(), 2)
+
+    def test_arun_batch_keeps_order_within_max_workers(self):
+        inputs = [{"index": index} for index in range(6)]
+        results = asyncio.run(self.runner.arun_batch(inputs))
+        self.assertEqual(results, [(True, f'{{"index":{i}}}') for i in range(6)])
+        self.assertLessEqual(self.max_concurrency(), 2)
+
+
+class ConfigTest(unittest.TestCase):
+    def test_unchecked_skips_validation(self):
+        config = ComponentConfig.unchecked("app", "action", {"input": {}}, timeout=0)
+        self.assertEqual(config.application_id, "app")
+        self.assertEqual(config.timeout, 0)
+        self.assertEqual(config.wasm_file, "actions.wasm")
+        with self.assertRaises(ConfigurationError):
+            ComponentConfig("app", "action", {"input": {}})
+
+    def test_unchecked_equals_validated_config(self):
+        payload = {"input": {"a": 1}}
+        self.assertEqual(
+            ComponentConfig.unchecked(APPLICATION_ID, ACTION_ID, payload),
+            ComponentConfig(APPLICATION_ID, ACTION_ID, payload),
+        )
+
+    def test_sanitize_input(self):
+        sanitize = BettyBlocksRunner._sanitize_input
+        clean = {"a": 1}
+        self.assertIs(sanitize(clean), clean)
+        self.assertEqual(sanitize(None), {})
+        self.assertEqual(sanitize({"a": 1, "b": None, 2: "c"}), {"a": 1})
+        with self.assertRaises(ConfigurationError):
+            sanitize(["a"])
+
+
+class ParseResultTest(unittest.TestCase):
+    def test_ok_string_is_unquoted(self):
+        result = wave.parse_result('ok("{\\"a\\":\\"\\u{1f600}\\n\\"}")')
+        self.assertEqual(result, (True, '{"a":"\U0001f600\n"}'))
+
+    def test_err_is_a_failure(self):
+        self.assertEqual(wave.parse_result('err("bad input")'), (False, "bad input"))
+
+    def test_unit_results(self):
+        self.assertEqual(wave.parse_result("ok"), (True, ""))
+        self.assertEqual(wave.parse_result("err"), (False, ""))
+
+    def test_other_values_are_returned_unchanged(self):
+        self.assertEqual(wave.parse_result('{result: "x"}'), (True, '{result: "x"}'))
+        self.assertEqual(wave.parse_result('("a", "b")'), (True, '("a", "b")'))
+
+    def test_quote_round_trips(self):
+        text = 'quote " backslash \\ tab \t bell \x07'
+        self.assertEqual(wave.unquote(wave.quote(text)), text)
+
+
+if __name__ == "__main__":
+    unittest.main()